@@ -5,12 +5,15 @@ from typing import Any, Callable
 import jsonschema
 import jsonschema.exceptions
 from .model import NeuroAction
+from . import jsonutil
 import json
 
 from websockets.asyncio.server import serve, ServerConnection
 
 ACTION_NAME_ALLOWED_CHARS = 'abcdefghijklmnopqrstuvwxyz0123456789_-'
 
+UNOFFICIAL_COMMAND_MESSAGE = 'This command is not officially supported.'
+
 # See https://github.com/VedalAI/neuro-game-sdk/blob/main/API/SPECIFICATION.md#action
 INVALID_SCHEMA_KEYS = ["$anchor", "$comment", "$defs", "$dynamicAnchor", "$dynamicRef", "$id", "$ref", "$schema", "$vocabulary", "additionalProperties", "allOf", "anyOf", "contentEncoding", "contentMediaType", "contentSchema", "dependentRequired", "dependentSchemas", "deprecated", "description", "else", "if", "maxProperties", "minProperties", "not", "oneOf", "patternProperties", "readOnly", "then", "title", "unevaluatedItems", "unevaluatedProperties", "writeOnly"]
 
@@ -74,7 +77,7 @@ class NeuroAPI:
         async for message in websocket:
             try:
                 json_cmd = json.loads(message)
-                self.log_raw(json.dumps(json_cmd, indent=2), True)
+                self.log_raw(jsonutil.dumps(json_cmd, indent=True), True)
 
                 game = json_cmd.get('game', {})
                 data = json_cmd.get('data', {})
@@ -158,7 +161,7 @@ class NeuroAPI:
                         self.on_action_result(ActionResultCommand(data['success'], data.get('message', None)))
 
                     case 'shutdown/ready':
-                        self.log_warning('This command is not officially supported.')
+                        self.log_warning(UNOFFICIAL_COMMAND_MESSAGE)
                         self.on_shutdown_ready(ShutdownReadyCommand())
 
                     case _:
@@ -170,21 +173,25 @@ class NeuroAPI:
 
     async def __handle_producer(self, websocket: ServerConnection):
         while True:
-            await asyncio.sleep(0.1)
-
-            message: str
+            message: str | None
             with self.queue_lock:
                 if self.message_queue.empty():
-                    continue
+                    message = None
+                else:
+                    message = self.message_queue.get_nowait()
 
-                message = await self.message_queue.get()
+            # Only poll coarsely while idle, so bursts of queued messages
+            # are sent back-to-back instead of one per polling interval
+            if message is None:
+                await asyncio.sleep(0.1)
+                continue
 
             await asyncio.sleep(self.get_delay())
 
             await websocket.send(message)
 
             try:
-                self.log_raw(json.dumps(json.loads(message), indent=2), False)
+                self.log_raw(jsonutil.dumps(json.loads(message), indent=True), False)
             except:
                 self.log_raw(message, False)
 
@@ -222,7 +229,7 @@ class NeuroAPI:
         with self.queue_lock:
             self.message_queue.put_nowait(message)
         self.log_system('Command sent: actions/reregister_all')
-        self.log_warning('This command is not officially supported.')
+        self.log_warning(UNOFFICIAL_COMMAND_MESSAGE)
 
     def send_shutdown_graceful(self, wants_shutdown: bool):
         '''Send a shutdown/graceful command.'''
@@ -237,7 +244,7 @@ class NeuroAPI:
         with self.queue_lock:
             self.message_queue.put_nowait(message)
         self.log_system('Command sent: shutdown/graceful')
-        self.log_warning('This command is not officially supported.')
+        self.log_warning(UNOFFICIAL_COMMAND_MESSAGE)
 
     def send_shutdown_immediate(self):
         '''Send a shutdown/immediate command.'''
@@ -249,7 +256,7 @@ class NeuroAPI:
         with self.queue_lock:
             self.message_queue.put_nowait(message)
         self.log_system('Command sent: shutdown/immediate')
-        self.log_warning('This command is not officially supported.')
+        self.log_warning(UNOFFICIAL_COMMAND_MESSAGE)
         
     def check_invalid_keys_recursive(self, sub_schema: dict[str, Any]) -> list[str]:
         '''
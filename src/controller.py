@@ -1,23 +1,12 @@
+import functools
+import itertools
 import random
-import jsonschema._utils
-import jsonschema.benchmarks
-import jsonschema.exceptions
-import jsonschema.tests
 import wx
-from jsf import JSF
 
 from .model import TonyModel, NeuroAction
-from .view import TonyView
+from .view import TonyView, LOG_LEVELS, call_on_main
 from .api import *
 
-def action_id_generator():
-    '''Generate a unique ID for an action.'''
-
-    i = 0
-    while True:
-        yield f'action_{i}'
-        i += 1
-
 class TonyController:
 
     def __init__(self, app: wx.App, log_level: str):
@@ -28,10 +17,14 @@ class TonyController:
 
         self.active_actions_force: ActionsForceCommand | None = None
 
-        self.id_generator = action_id_generator()
+        self._id_counter = itertools.count()
 
         self.inject()
 
+        # Prebound shutdown/graceful senders for the button-press handlers
+        self._send_shutdown_want = functools.partial(self.api.send_shutdown_graceful, True)
+        self._send_shutdown_cancel = functools.partial(self.api.send_shutdown_graceful, False)
+
     def run(self, address: str, port: int):
         self.api.start(address, port)
         self.view.show()
@@ -54,15 +47,45 @@ class TonyController:
         self.api.log_warning = self.view.log_warning
         self.api.log_error = self.view.log_error
         self.api.log_raw = self.view.log_raw
-        self.api.get_delay = lambda: float(self.view.controls.latency / 1000)
+        self.api.get_delay = lambda: self.view.controls.latency_s
+
+        # Bound log methods for the hot handlers, saving an attribute chain per call
+        self._log_system = self.view.log_system
+        self._log_debug = self.view.log_debug
+        self._log_info = self.view.log_info
+        self._log_warning = self.view.log_warning
+        self._log_description = self.view.log_description
+
+        self.view.handlers.update({
+            'execute': self.on_view_execute,
+            'delete_action': self.on_view_delete_action,
+            'unlock': self.on_view_unlock,
+            'send_actions_reregister_all': self.on_view_send_actions_reregister_all,
+            'send_shutdown_graceful': self.on_view_send_shutdown_graceful,
+            'send_shutdown_graceful_cancel': self.on_view_send_shutdown_graceful_cancel,
+            'send_shutdown_immediate': self.on_view_send_shutdown_immediate,
+        })
+
+    def prepare_sample(self, action: NeuroAction):
+        '''
+        Pre-generate the sample JSON shown in the action dialog.
+        Runs on the API thread during registration, so opening the dialog doesn't have to generate it.
+        '''
+
+        if not action.has_schema:
+            return
+
+        # JSF raises on schemas it doesn't support; leave the sample empty so the
+        # dialog falls back to generating it lazily for just this action
+        try:
+            action._sample_json = jsonutil.dumps(action.get_faker().generate(), indent=True)
+        except Exception as e:
+            self._log_debug(lambda: f'Could not pre-generate sample for action "{action.name}": {e}')
 
-        self.view.on_execute = self.on_view_execute
-        self.view.on_delete_action = self.on_view_delete_action
-        self.view.on_unlock = self.on_view_unlock
-        self.view.on_send_actions_reregister_all = self.on_view_send_actions_reregister_all
-        self.view.on_send_shutdown_graceful = self.on_view_send_shutdown_graceful
-        self.view.on_send_shutdown_graceful_cancel = self.on_view_send_shutdown_graceful_cancel
-        self.view.on_send_shutdown_immediate = self.on_view_send_shutdown_immediate
+    def _next_id(self) -> str:
+        '''Generate a unique ID for an action.'''
+
+        return f'action_{next(self._id_counter)}'
 
     def on_any_command(self, cmd: Any):
         '''Callback for any command received from the API.'''
@@ -81,28 +104,41 @@ class TonyController:
     def on_actions_register(self, cmd: ActionsRegisterCommand):
         '''Handle the actions/register command.'''
 
+        new_actions = []
+        log_lines = []
+        description_lines = []
+
         for action in cmd.actions:
 
             # Check if an action with the same name already exists
             if self.model.has_action(action.name):
-                self.view.log_warning(f'Action "{action.name}" already exists. Ignoring.')
+                self._log_warning(f'Action "{action.name}" already exists. Ignoring.')
                 continue
-            
+
             self.model.add_action(action)
-            wx.CallAfter(self.view.add_action, action)
-            self.view.log_system(f'Action registered: {action.name}')
-            self.view.log_description(f'{action.name}: {action.description}')
+            self.prepare_sample(action)
+            action.compile_validator()
+            new_actions.append(action)
+            log_lines.append(f'Action registered: {action.name}')
+            description_lines.append(f'{action.name}: {action.description}')
+
+        # Post a single event to the UI thread and one log append per panel
+        # instead of one per action
+        if new_actions:
+            wx.CallAfter(self.view.add_actions, new_actions)
+            self._log_system('\n'.join(log_lines))
+            self._log_description('\n'.join(description_lines))
 
     def on_actions_unregister(self, cmd: ActionsUnregisterCommand):
         '''Handle the actions/unregister command.'''
 
         for name in cmd.action_names:
             if not self.model.has_action(name):
-                self.view.log_info(f'Action "{name}" does not exist.')
+                self._log_info(f'Action "{name}" does not exist.')
 
             self.model.remove_action_by_name(name)
             self.view.remove_action_by_name(name)
-            self.view.log_system(f'Action unregistered: {name}')
+            self._log_system(f'Action unregistered: {name}')
 
     def on_actions_force(self, cmd: ActionsForceCommand):
         '''Handle the actions/force command.'''
@@ -110,18 +146,20 @@ class TonyController:
         if cmd.state is not None and cmd.state != '':
             self.view.log_state(cmd.state, cmd.ephemeral_context)
         else:
-            self.view.log_info('actions/force command contains no state.')
+            self._log_info('actions/force command contains no state.')
 
         self.view.log_query(cmd.query, cmd.ephemeral_context)
 
         if self.view.controls.ignore_actions_force:
-            self.view.log_system('Forced action ignored.')
+            self._log_system('Forced action ignored.')
             self.active_actions_force = None
             return
         
         # Check if all actions exist
-        if not all(self.model.has_action(name) for name in cmd.action_names):
-            self.view.log_warning('actions/force with invalid actions received. Discarding.\nInvalid actions: ' + ', '.join(name for name in cmd.action_names if not self.model.has_action(name)))
+        registered = self.model.action_names
+        missing = [name for name in cmd.action_names if name not in registered]
+        if missing:
+            self._log_warning('actions/force with invalid actions received. Discarding.\nInvalid actions: ' + ', '.join(missing))
             self.active_actions_force = None
             return
 
@@ -130,9 +168,9 @@ class TonyController:
     def on_action_result(self, cmd: ActionResultCommand):
         '''Handle the action/result command.'''
 
-        self.view.log_system('Action result indicates ' + ('success' if cmd.success else 'failure'))
+        self._log_system('Action result indicates ' + ('success' if cmd.success else 'failure'))
 
-        self.view.log_debug(f'cmd.success: {cmd.success}, active_actions_force: {self.active_actions_force}')
+        self._log_debug(lambda: f'cmd.success: {cmd.success}, active_actions_force: {self.active_actions_force}')
 
         if not cmd.success and self.active_actions_force is not None:
             self.retry_actions_force(self.active_actions_force)
@@ -142,26 +180,30 @@ class TonyController:
         if cmd.message is not None:
             self.view.log_action_result(cmd.success, cmd.message)
         elif cmd.success:
-            self.view.log_info('Successful action result contains no message.')
+            self._log_info('Successful action result contains no message.')
         else:
-            self.view.log_warning('Failed action result contains no message.')
+            self._log_warning('Failed action result contains no message.')
 
         wx.CallAfter(self.view.on_action_result, cmd.success, cmd.message)
 
     def on_shutdown_ready(self, cmd: ShutdownReadyCommand):
         '''Handle the shutdown/ready command.'''
 
-        self.view.log_warning('This command is not officially supported.')
+        self._log_warning(UNOFFICIAL_COMMAND_MESSAGE)
 
     def on_unknown_command(self, json_cmd: Any):
         '''Handle an unknown command.'''
 
-        # self.view.log_warning(f'Unknown command received: {json_cmd['command']}')
+        # Check the log level first so the message is never formatted when warnings are suppressed
+        if self.view.controls.get_log_level() > LOG_LEVELS['WARNING']:
+            return
+
+        self._log_warning(f'Unknown command received: {json_cmd["command"]}')
 
     def send_action(self, id: str, name: str, data: str | None):
         '''Send an action command to the API.'''
 
-        self.view.log_system(f'Sending action: {name}')
+        self._log_system(f'Sending action: {name}')
         self.api.send_action(id, name, data)
 
         self.view.disable_actions() # Disable the actions until the result is received
@@ -177,8 +219,8 @@ class TonyController:
         Returns True if an action was sent, False if the action was cancelled.
         '''
 
-        if not action.schema:
-            self.send_action(next(self.id_generator), action.name, None) # No schema, so send the action immediately
+        if not action.has_schema:
+            self.send_action(self._next_id(), action.name, None) # No schema, so send the action immediately
             return True
         
         # If there is a schema, open a dialog to get the data
@@ -186,7 +228,7 @@ class TonyController:
         if result is None:
             return False # User cancelled the dialog
         
-        self.send_action(next(self.id_generator), action.name, result)
+        self.send_action(self._next_id(), action.name, result)
         return True
 
     def on_view_delete_action(self, name: str):
@@ -195,30 +237,30 @@ class TonyController:
         self.model.remove_action_by_name(name)
         self.view.remove_action_by_name(name)
 
-        self.view.log_system(f'Action deleted: {name}')
+        self._log_system(f'Action deleted: {name}')
 
     def on_view_unlock(self):
         '''Handle a request to unlock the view.'''
 
-        self.view.log_system('Unlocking actions.')
+        self._log_system('Unlocking actions.')
         self.view.enable_actions()
 
     def on_view_send_actions_reregister_all(self):
         '''Handle a request to send an actions/reregister_all command from the view.'''
 
         self.model.clear_actions()
-        wx.CallAfter(self.view.clear_actions)
+        call_on_main(self.view.clear_actions) # Already on the UI thread when triggered by the button
         self.send_actions_reregister_all()
 
     def on_view_send_shutdown_graceful(self):
         '''Handle a request to send a shutdown/graceful command with wants_shutdown=true from the view.'''
 
-        self.api.send_shutdown_graceful(True)
+        self._send_shutdown_want()
 
     def on_view_send_shutdown_graceful_cancel(self):
         '''Handle a request to send a shutdown/graceful with wants_shutdown=false command from the view.'''
 
-        self.api.send_shutdown_graceful(False)
+        self._send_shutdown_cancel()
 
     def on_view_send_shutdown_immediate(self):
         '''Handle a request to send a shutdown/immediate command from the view.'''
@@ -228,17 +270,20 @@ class TonyController:
     def execute_actions_force(self, cmd: ActionsForceCommand, retry: bool = False):
         self.active_actions_force = cmd
 
-        if self.view.controls.auto_send:
-            self.view.log_system('Automatically sending random action.')
-            actions = [action for action in self.model.actions if action.name in cmd.action_names]
-            action = random.choice(actions)
+        controls = self.view.controls # Snapshot to avoid re-walking the attribute chain
+
+        if controls.auto_send:
+            self._log_system('Automatically sending random action.')
+            # Pick a name first, then resolve only the chosen action.
+            # Deduplicated so repeated names don't skew the choice.
+            name = random.choice(tuple(set(cmd.action_names)))
+            action = self.model.get_action_by_name(name)
 
-            if action.schema is None:
-                self.send_action(next(self.id_generator), action.name, None)
+            if not action.has_schema:
+                self.send_action(self._next_id(), action.name, None)
             else:
-                faker = JSF(action.schema)
-                sample = faker.generate()
-                self.send_action(next(self.id_generator), action.name, json.dumps(sample))
+                sample = action.get_faker().generate()
+                self.send_action(self._next_id(), action.name, json.dumps(sample))
                 
         else:
             wx.CallAfter(self.view.force_actions, cmd.state, cmd.query, cmd.ephemeral_context, cmd.action_names, retry)
@@ -246,17 +291,21 @@ class TonyController:
     def retry_actions_force(self, cmd: ActionsForceCommand):
         '''Retry the actions/force command.'''
 
-        if self.view.controls.ignore_actions_force:
-            self.view.log_system('Forced action ignored.')
+        controls = self.view.controls
+
+        if controls.ignore_actions_force:
+            self._log_system('Forced action ignored.')
             self.active_actions_force = None
             return
         
         # Check if all actions exist
-        if not all(self.model.has_action(name) for name in cmd.action_names):
-            self.view.log_warning('Actions have been unregistered before retrying the forced action. Retry aborted.\nInvalid actions: ' + ', '.join(name for name in cmd.action_names if not self.model.has_action(name)))
+        registered = self.model.action_names
+        missing = [name for name in cmd.action_names if name not in registered]
+        if missing:
+            self._log_warning('Actions have been unregistered before retrying the forced action. Retry aborted.\nInvalid actions: ' + ', '.join(missing))
             self.active_actions_force = None
             return
         
-        self.view.log_system('Retrying forced action.')
+        self._log_system('Retrying forced action.')
 
         self.execute_actions_force(cmd, retry=True)
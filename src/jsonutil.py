@@ -0,0 +1,17 @@
+import json
+from typing import Any
+
+# orjson serializes several times faster than the standard library,
+# but keep working without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    '''Serialize an object to a JSON string, optionally indented by 2 spaces.'''
+
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+
+    return json.dumps(obj, indent=2 if indent else None)
@@ -1,49 +1,107 @@
-from typing import Any, Optional
+from typing import Any, Callable, Optional, TYPE_CHECKING
+
+from . import jsonutil
+
+# fastjsonschema compiles schemas to plain Python functions that validate much
+# faster than jsonschema, but keep working without it
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+if TYPE_CHECKING:
+    from jsf import JSF
 
 class TonyModel:
-    
+
     def __init__(self):
-        self.actions: list[NeuroAction] = []
+        self._actions: dict[str, 'NeuroAction'] = {}
+
+    @property
+    def actions(self) -> list['NeuroAction']:
+        '''The list of registered actions.'''
+
+        return list(self._actions.values())
+
+    @property
+    def action_names(self):
+        '''A set-like view of the registered action names.'''
+
+        return self._actions.keys()
 
     def add_action(self, action: 'NeuroAction'):
         '''Add an action to the list.'''
-        
-        self.actions.append(action)
+
+        self._actions[action.name] = action
 
     def remove_action(self, action: 'NeuroAction'):
         '''Remove an action from the list.'''
-        
-        self.actions.remove(action)
-        pass
+
+        self._actions.pop(action.name, None)
 
     def remove_action_by_name(self, name: str):
         '''Remove an action from the list by name.'''
-        
-        self.actions = [action for action in self.actions if action.name != name]
-        pass
+
+        self._actions.pop(name, None)
 
     def clear_actions(self):
         '''Clear all actions from the list.'''
-        
-        self.actions.clear()
-        pass
+
+        self._actions.clear()
 
     def has_action(self, name: str) -> bool:
         '''Check if an action exists in the list.'''
-        
-        return any(action.name == name for action in self.actions)
-    
+
+        return name in self._actions
+
     def get_action_by_name(self, name: str) -> Optional['NeuroAction']:
         '''Get an action by name.'''
-        
-        for action in self.actions:
-            if action.name == name:
-                return action
-        return None
+
+        return self._actions.get(name)
 
 class NeuroAction:
-    
+
     def __init__(self, name: str, description: str, schema: Optional[dict[str, Any]]):
         self.name = name
         self.description = description
         self.schema = schema
+        self.has_schema = bool(schema) # Precomputed so hot paths don't re-test dict truthiness
+
+        self._faker: Optional['JSF'] = None # Lazily compiled, dies with the action
+        self._sample_json: Optional[str] = None # Pre-generated dialog sample, filled in at registration
+        self._schema_pretty: Optional[str] = None # Pretty-printed schema, formatted on first use
+        self._validate_fn: Optional[Callable[[Any], Any]] = None # Compiled fast validator, filled in at registration
+
+    def compile_validator(self):
+        '''
+        Compile the schema to a fast validator function, if fastjsonschema is available.
+        Schemas it cannot compile are left to jsonschema at validation time.
+        '''
+
+        if fastjsonschema is None or not self.has_schema or self._validate_fn is not None:
+            return
+
+        # Compilation can fail beyond invalid schemas: remote $refs are resolved
+        # over the network, so network errors must not unwind into the caller
+        try:
+            self._validate_fn = fastjsonschema.compile(self.schema)
+        except Exception:
+            self._validate_fn = None
+
+    def get_schema_pretty(self) -> str:
+        '''Get the schema as pretty-printed JSON, formatting it on first use.'''
+
+        if self._schema_pretty is None:
+            self._schema_pretty = jsonutil.dumps(self.schema, indent=True) if self.schema is not None else '(no schema)'
+
+        return self._schema_pretty
+
+    def get_faker(self) -> 'JSF':
+        '''Get the compiled faker for this action's schema, compiling it on first use.'''
+
+        if self._faker is None:
+            from jsf import JSF # Deferred, jsf is heavy to import
+
+            self._faker = JSF(self.schema)
+
+        return self._faker
@@ -1,13 +1,21 @@
 import json
+from collections import deque
+from threading import Lock
 from typing import Any, Callable, Optional
 import jsonschema
 import wx
+import wx.stc
 from datetime import datetime as dt
-from jsf import JSF
 
+from . import jsonutil
 from .constants import VERSION
 from .model import TonyModel, NeuroAction
 
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 #region Events
 
 EVTTYPE_ADD_ACTION = wx.NewEventType()
@@ -65,6 +73,10 @@ LOG_COLOR_RAW_OUTGOING              = wx.Colour(255, 128, 192)
 
 UI_COLOR_ERROR = wx.Colour(255, 192, 192)
 
+LOG_FLUSH_INTERVAL_MS = 30 # How long pending log output may sit before it is flushed to the control
+MAX_LOG_LINES = 5000 # How many lines are kept when the log is trimmed
+LOG_TRIM_WATERMARK = 5500 # Line count above which the oldest lines are dropped
+
 LOG_LEVELS = {
     'DEBUG': 10,
     'INFO': 20,
@@ -74,8 +86,63 @@ LOG_LEVELS = {
     'SYSTEM': 60,
 }
 
+# Numeric thresholds hoisted so the per-call level checks skip the dict lookup
+_LVL_DEBUG   = LOG_LEVELS['DEBUG']
+_LVL_INFO    = LOG_LEVELS['INFO']
+_LVL_WARNING = LOG_LEVELS['WARNING']
+_LVL_ERROR   = LOG_LEVELS['ERROR']
+_LVL_SYSTEM  = LOG_LEVELS['SYSTEM']
+
 #endregion
 
+def _noop(*args) -> None:
+    '''Default handler that does nothing.'''
+
+def call_on_main(func: Callable, *args):
+    '''
+    Run a function on the UI thread.
+    Calls it directly if already on the UI thread, avoiding an event-loop roundtrip;
+    otherwise schedules it with wx.CallAfter.
+    '''
+
+    if wx.IsMainThread():
+        func(*args)
+    else:
+        wx.CallAfter(func, *args)
+
+_timestamp_cache: tuple[int, str] = (0, '')
+
+def _timestamp() -> str:
+    '''Format the current time for the log, reusing the result within the same second.'''
+
+    global _timestamp_cache
+
+    now = dt.now()
+    sec = int(now.timestamp())
+
+    if _timestamp_cache[0] != sec:
+        _timestamp_cache = (sec, now.strftime('%X'))
+
+    return _timestamp_cache[1]
+
+_VALIDATOR_CACHE: dict[str, 'jsonschema.protocols.Validator'] = {}
+
+def _get_validator(schema: dict[str, Any]) -> 'jsonschema.protocols.Validator':
+    '''
+    Get a validator for a schema, compiling and caching it on first use.
+    Schemas are immutable per action, so the validator can be reused for every validation.
+    '''
+
+    key = json.dumps(schema, sort_keys=True)
+    validator = _VALIDATOR_CACHE.get(key)
+
+    if validator is None:
+        cls = jsonschema.validators.validator_for(schema)
+        cls.check_schema(schema)
+        validator = _VALIDATOR_CACHE[key] = cls(schema)
+
+    return validator
+
 class TonyView:
     '''The view class for Tony.'''
 
@@ -90,49 +157,60 @@ class TonyView:
 
         self.action_dialog: Optional[ActionDialog] = None
 
-        # Dependency injection
-        self.on_execute: Callable[[NeuroAction], bool] = lambda action: None
-        self.on_delete_action: Callable[[str], None] = lambda name: None
-        self.on_unlock: Callable[[], None] = lambda: None
-        self.on_send_actions_reregister_all: Callable[[], None] = lambda: None
-        self.on_send_shutdown_graceful: Callable[[], None] = lambda: None
-        self.on_send_shutdown_graceful_cancel: Callable[[], None] = lambda: None
-        self.on_send_shutdown_immediate: Callable[[], None] = lambda: None
+        # Dependency injection. dispatch(name, _noop)() calls the injected
+        # handler of that name, or does nothing if none was injected.
+        self.handlers: dict[str, Callable] = {}
+        self.dispatch = self.handlers.get
 
     def show(self):
         '''Show the main frame.'''
 
         self.frame.Show()
 
-    def log_system(self, message: str):
+    def is_enabled_for(self, level: int) -> bool:
+        '''Check if messages at the given log level would be logged.'''
+
+        return self.controls.get_log_level() <= level
+
+    def log_system(self, message: str | Callable[[], str]):
         '''Log a command.'''
 
-        if self.controls.get_log_level() <= LOG_LEVELS['SYSTEM']:
-            self.frame.panel.log_notebook.log_panel.log(message)
+        if self.controls.get_log_level() <= _LVL_SYSTEM:
+            if callable(message):
+                message = message()
+            self.frame.panel.log_notebook.log_panel.log_one(message)
 
-    def log_debug(self, message: str):
-        '''Log a debug message.'''
+    def log_debug(self, message: str | Callable[[], str]):
+        '''Log a debug message. Accepts a callable so suppressed messages are never formatted.'''
 
-        if self.controls.get_log_level() <= LOG_LEVELS['DEBUG']:
-            self.frame.panel.log_notebook.log_panel.log(message, 'Debug', LOG_COLOR_DEBUG)
+        if self.controls.get_log_level() <= _LVL_DEBUG:
+            if callable(message):
+                message = message()
+            self.frame.panel.log_notebook.log_panel.log_one(message, 'Debug', LOG_COLOR_DEBUG)
 
-    def log_info(self, message: str):
+    def log_info(self, message: str | Callable[[], str]):
         '''Log an informational message.'''
 
-        if self.controls.get_log_level() <= LOG_LEVELS['INFO']:
-            self.frame.panel.log_notebook.log_panel.log(message, 'Info', LOG_COLOR_INFO)
+        if self.controls.get_log_level() <= _LVL_INFO:
+            if callable(message):
+                message = message()
+            self.frame.panel.log_notebook.log_panel.log_one(message, 'Info', LOG_COLOR_INFO)
 
-    def log_warning(self, message: str):
+    def log_warning(self, message: str | Callable[[], str]):
         '''Log a warning message.'''
 
-        if self.controls.get_log_level() <= LOG_LEVELS['WARNING']:
-            self.frame.panel.log_notebook.log_panel.log(message, 'Warning', LOG_COLOR_WARNING)
+        if self.controls.get_log_level() <= _LVL_WARNING:
+            if callable(message):
+                message = message()
+            self.frame.panel.log_notebook.log_panel.log_one(message, 'Warning', LOG_COLOR_WARNING)
 
-    def log_error(self, message: str):
+    def log_error(self, message: str | Callable[[], str]):
         '''Log an error message.'''
 
-        if self.controls.get_log_level() <= LOG_LEVELS['ERROR']:
-            self.frame.panel.log_notebook.log_panel.log(message, 'Error', LOG_COLOR_ERROR)
+        if self.controls.get_log_level() <= _LVL_ERROR:
+            if callable(message):
+                message = message()
+            self.frame.panel.log_notebook.log_panel.log_one(message, 'Error', LOG_COLOR_ERROR)
 
     def log_context(self, message: str, silent: bool = False):
         '''Log a context message.'''
@@ -144,12 +222,12 @@ class TonyView:
             tags.append('silent')
             colors.append(LOG_COLOR_CONTEXT_SILENT)
 
-        self.frame.panel.log_notebook.context_log_panel.log(message, tags, colors)
+        self.frame.panel.log_notebook.context_log_panel.log_many(message, tags, colors)
 
     def log_description(self, message: str):
         '''Log an action description.'''
 
-        self.frame.panel.log_notebook.context_log_panel.log(message, 'Action', LOG_COLOR_CONTEXT)
+        self.frame.panel.log_notebook.context_log_panel.log_one(message, 'Action', LOG_COLOR_CONTEXT)
 
     def log_query(self, message: str, ephemeral: bool = False):
         '''Log an actions/force query.'''
@@ -161,7 +239,7 @@ class TonyView:
             tags.append('ephemeral')
             colors.append(LOG_COLOR_CONTEXT_EPHEMERAL)
 
-        self.frame.panel.log_notebook.context_log_panel.log(message, tags, colors)
+        self.frame.panel.log_notebook.context_log_panel.log_many(message, tags, colors)
 
     def log_state(self, message: str, ephemeral: bool = False):
         '''Log an actions/force state.'''
@@ -173,13 +251,13 @@ class TonyView:
             tags.append('Ephemeral')
             colors.append(LOG_COLOR_CONTEXT_EPHEMERAL)
 
-        self.frame.panel.log_notebook.context_log_panel.log(message, tags, colors)
+        self.frame.panel.log_notebook.context_log_panel.log_many(message, tags, colors)
 
     def log_action_result(self, success: bool, message: str | None):
         '''Log an action result message.'''
 
         
-        self.frame.panel.log_notebook.context_log_panel.log(message, 'Result', LOG_COLOR_CONTEXT_ACTION_RESULT_SUCCESS if success else LOG_COLOR_CONTEXT_ACTION_RESULT_FAILURE)
+        self.frame.panel.log_notebook.context_log_panel.log_one(message, 'Result', LOG_COLOR_CONTEXT_ACTION_RESULT_SUCCESS if success else LOG_COLOR_CONTEXT_ACTION_RESULT_FAILURE)
 
     def log_raw(self, message: str, incoming: bool):
         '''Log raw data.'''
@@ -187,10 +265,13 @@ class TonyView:
         tag = 'Game --> Neuro' if incoming else 'Game <-- Neuro'
         color = LOG_COLOR_RAW_INCOMING if incoming else LOG_COLOR_RAW_OUTGOING
 
-        self.frame.panel.log_notebook.raw_log_panel.log(message, tag, color)
+        self.frame.panel.log_notebook.raw_log_panel.log_one(message, tag, color)
 
     def show_action_dialog(self, action: NeuroAction) -> Optional[str]:
-        '''Show a dialog for an action. Returns the JSON string the user entered if "Send" was clicked, otherwise None.'''
+        '''
+        Show a dialog for an action. Returns the JSON string the user entered if "Send" was clicked, otherwise None.
+        The modal loop only blocks the UI thread; the websocket keeps being serviced on the API thread.
+        '''
 
         self.action_dialog = ActionDialog(self.frame, action, self.controls.validate_schema)
         result = self.action_dialog.ShowModal()
@@ -219,6 +300,11 @@ class TonyView:
 
         self.frame.panel.action_list.add_action(action)
 
+    def add_actions(self, actions: list[NeuroAction]):
+        '''Add multiple actions to the list in one batch.'''
+
+        self.frame.panel.action_list.add_actions(actions)
+
     def remove_action_by_name(self, name: str):
         '''Remove an action from the list by name.'''
 
@@ -226,18 +312,19 @@ class TonyView:
 
     def enable_actions(self):
         '''Enable all action buttons.'''
-        
-        wx.CallAfter(self.frame.panel.action_list.execute_button.Enable)
+
+        call_on_main(self.frame.panel.action_list.execute_button.Enable)
 
     def disable_actions(self):
         '''Disable all action buttons.'''
-        
-        self.frame.panel.action_list.execute_button.Disable()
+
+        call_on_main(self.frame.panel.action_list.execute_button.Disable)
 
     def force_actions(self, state: str, query: str, ephemeral_context: bool, action_names: list[str], retry: bool = False):
         '''Show a dialog for forcing actions.'''
 
-        actions = [action for action in self.model.actions if action.name in action_names]
+        # Resolve each requested name directly instead of scanning the whole registry
+        actions = [action for name in action_names if (action := self.model.get_action_by_name(name)) is not None]
         actions_force_dialog = ActionsForceDialog(self.frame, self, state, query, ephemeral_context, actions, retry)
         result = actions_force_dialog.ShowModal()
         actions_force_dialog.Destroy()
@@ -265,12 +352,17 @@ class MainFrame(wx.Frame):
     def __init__(self, view: TonyView):
         super().__init__(None, title='Tony v' + VERSION)
 
+        self.Freeze() # Defer layout and painting until all children exist
+
         self.view = view
         self.panel = MainPanel(self)
-        
+
         best_size: wx.Size = self.panel.GetBestSize()
         self.SetSize((850, 600))
 
+        self.Layout()
+        self.Thaw()
+
 class MainPanel(wx.Panel):
     '''The main panel for Tony.'''
 
@@ -299,6 +391,7 @@ class ActionList(wx.Panel):
         super().__init__(parent, style=wx.BORDER_SUNKEN)
 
         self.actions: list[NeuroAction] = []
+        self._by_name: dict[str, NeuroAction] = {} # Index for O(1) lookup and removal by name
 
         self.list = wx.ListCtrl(self, style=wx.LC_REPORT | wx.LC_SINGLE_SEL)
         button_panel = wx.Panel(self)
@@ -332,24 +425,39 @@ class ActionList(wx.Panel):
         '''Add an action panel to the list.'''
 
         self.actions.append(action)
+        self._by_name[action.name] = action
 
         self.list.Append([action.name, action.description, 'Yes' if action.schema is not None and action.schema != {} else 'No'])
 
+    def add_actions(self, actions: list[NeuroAction]):
+        '''Add multiple action panels to the list in one batch, suppressing intermediate repaints.'''
+
+        self.list.Freeze()
+        try:
+            for action in actions:
+                self.add_action(action)
+        finally:
+            self.list.Thaw()
+
     def remove_action_by_name(self, name: str):
         '''Remove an action panel from the list.'''
 
-        self.actions = [action for action in self.actions if action.name != name]
-        
+        action = self._by_name.pop(name, None)
+        if action is None:
+            self.GetTopLevelParent().view.log_error(f'Action "{name}" not found in list.')
+            return
+
+        self.actions.remove(action)
+
         index = self.list.FindItem(-1, name)
         if(index != -1):
             self.list.DeleteItem(index)
-        else:
-            self.GetTopLevelParent().view.log_error(f'Action "{name}" not found in list.')
-    
+
     def clear(self):
         '''Clear the list of actions.'''
 
         self.actions.clear()
+        self._by_name.clear()
         self.list.DeleteAllItems()
 
     def on_execute(self, event: wx.CommandEvent):
@@ -363,7 +471,7 @@ class ActionList(wx.Panel):
         action = self.actions[index]
 
         top: MainFrame = self.GetTopLevelParent()
-        sent = top.view.on_execute(action)
+        sent = top.view.dispatch('execute', _noop)(action)
         
         if sent:
             self.GetEventHandler().ProcessEvent(ExecuteEvent(self.GetId(), action))
@@ -380,13 +488,13 @@ class ActionList(wx.Panel):
         action: NeuroAction = self.actions[index]
 
         top: MainFrame = self.GetTopLevelParent()
-        top.view.on_delete_action(action.name)
+        top.view.dispatch('delete_action', _noop)(action.name)
 
     def on_unlock(self, event: wx.CommandEvent):
         event.Skip()
 
         top: MainFrame = self.GetTopLevelParent()
-        top.view.on_unlock()
+        top.view.dispatch('unlock', _noop)()
     
 class LogNotebook(wx.Notebook):
     '''The notebook for logging messages.'''
@@ -396,7 +504,7 @@ class LogNotebook(wx.Notebook):
 
         self.log_panel = LogPanel(self)
         self.context_log_panel = LogPanel(self)
-        self.raw_log_panel = LogPanel(self, text_ctrl_style=wx.TE_MULTILINE | wx.TE_READONLY | wx.TE_RICH | wx.HSCROLL)
+        self.raw_log_panel = LogPanel(self, wrap=False)
 
         self.AddPage(self.log_panel, 'Log')
         self.AddPage(self.context_log_panel, 'Context')
@@ -405,16 +513,36 @@ class LogNotebook(wx.Notebook):
 class LogPanel(wx.Panel):
     '''The panel for logging messages.'''
 
-    def __init__(self, parent, text_ctrl_style = wx.TE_MULTILINE | wx.TE_READONLY | wx.TE_RICH):
+    def __init__(self, parent, wrap: bool = True):
         super().__init__(parent, style=wx.BORDER_SUNKEN)
 
-        self.text = wx.TextCtrl(self, style=text_ctrl_style)
+        # StyledTextCtrl appends in amortized O(1) regardless of buffer size,
+        # unlike a rich wx.TextCtrl which reflows its attribute runs
+        self.text = wx.stc.StyledTextCtrl(self)
+        self.text.SetMarginWidth(1, 0) # Hide the symbol margin
+        self.text.SetWrapMode(wx.stc.STC_WRAP_WORD if wrap else wx.stc.STC_WRAP_NONE)
+        self.text.SetReadOnly(True)
+
+        self._styles: dict[int, int] = {} # Scintilla style numbers keyed by color RGBA
+
         self.sizer = wx.BoxSizer(wx.VERTICAL)
         self.sizer.Add(self.text, 1, wx.EXPAND)
         self.SetSizer(self.sizer)
 
+        # Pending colored segments, flushed to the control in one batch per timer tick.
+        # Appended to from the API thread, so access is guarded by a lock.
+        self._pending: deque[tuple[wx.Colour, str]] = deque()
+        self._pending_lock = Lock()
+        self._flush_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_flush_timer, self._flush_timer)
+        self.Bind(wx.EVT_WINDOW_DESTROY, self.on_destroy)
+
     def log(self, message: str, tags: str | list[str] | None = [], tag_colors: wx.Colour | list[wx.Colour] | None = []):
-        '''Log a message with optional tags and colors.'''
+        '''
+        Log a message with optional tags and colors.
+        Fallback for polymorphic arguments; callers with a known shape
+        should use log_one or log_many directly.
+        '''
 
         # Convert single tags and colors to lists
         if isinstance(tags, str):
@@ -429,18 +557,112 @@ class LogPanel(wx.Panel):
         # Add default color for tags without color
         tag_colors += [LOG_COLOR_DEFAULT] * (len(tags) - len(tag_colors))
 
+        self.log_many(message, tags, tag_colors)
+
+    def log_one(self, message: str, tag: Optional[str] = None, color: Optional[wx.Colour] = None):
+        '''Log a message with at most one tag, skipping the normalization in log().'''
+
+        self._append_run(LOG_COLOR_TIMESTAMP, f'[{_timestamp()}] ')
+
+        if tag is not None:
+            self._append_run(color or LOG_COLOR_DEFAULT, f'[{tag}] ')
+
+        self._append_run(LOG_COLOR_DEFAULT, f'{message}\n')
+
+        call_on_main(self._start_flush_timer) # Timers must be started on the UI thread
+
+    def log_many(self, message: str, tags: list[str], tag_colors: list[wx.Colour]):
+        '''Log a message with multiple pre-paired tags and colors.'''
+
         # Log timestamp
-        self.text.SetDefaultStyle(wx.TextAttr(LOG_COLOR_TIMESTAMP))
-        self.text.AppendText(f'[{dt.now().strftime("%X")}] ')
-        
+        self._append_run(LOG_COLOR_TIMESTAMP, f'[{_timestamp()}] ')
+
         # Log tags
         for tag, tag_color in zip(tags, tag_colors):
-            self.text.SetDefaultStyle(wx.TextAttr(tag_color))
-            self.text.AppendText(f'[{tag}] ')
-        
+            self._append_run(tag_color, f'[{tag}] ')
+
         # Log message
-        self.text.SetDefaultStyle(wx.TextAttr(LOG_COLOR_DEFAULT))
-        self.text.AppendText(f'{message}\n')
+        self._append_run(LOG_COLOR_DEFAULT, f'{message}\n')
+
+        call_on_main(self._start_flush_timer) # Timers must be started on the UI thread
+
+    def _append_run(self, color: wx.Colour, segment: str):
+        '''
+        Append a colored segment to the pending output,
+        merging it into the previous segment if the color is unchanged.
+        '''
+
+        # The merge is a read-modify-write of the last element, so it must not
+        # interleave with a flush swapping the deque out
+        with self._pending_lock:
+            pending = self._pending
+
+            if pending and pending[-1][0] == color:
+                pending[-1] = (color, pending[-1][1] + segment)
+            else:
+                pending.append((color, segment))
+
+    def _start_flush_timer(self):
+        '''Start the flush timer if it is not already running.'''
+
+        if not self._flush_timer.IsRunning():
+            self._flush_timer.StartOnce(LOG_FLUSH_INTERVAL_MS)
+
+    def on_flush_timer(self, event: wx.TimerEvent):
+        self.flush()
+
+    def on_destroy(self, event: wx.WindowDestroyEvent):
+        event.Skip()
+
+        # Flush synchronously so no pending output is lost
+        if event.GetEventObject() is self:
+            self._flush_timer.Stop()
+            self.flush()
+
+    def _style_for(self, color: wx.Colour) -> int:
+        '''Get the Scintilla style number for a color, defining it on first use.'''
+
+        key = color.GetRGBA()
+        style = self._styles.get(key)
+
+        if style is None:
+            style = len(self._styles) + 1 # Style 0 is the Scintilla default
+            self.text.StyleSetForeground(style, color)
+            self._styles[key] = style
+
+        return style
+
+    def flush(self):
+        '''Flush all pending log segments to the text control in one batch.'''
+
+        # Swap the deque out under the lock so segments appended during the
+        # flush are neither dropped nor iterated while being mutated
+        with self._pending_lock:
+            if not self._pending:
+                return
+
+            pending = self._pending
+            self._pending = deque()
+
+        text = self.text
+        text.SetReadOnly(False)
+        text.Freeze()
+        try:
+            for color, segment in pending:
+                start = text.GetLength()
+                text.AppendText(segment)
+                text.StartStyling(start)
+                text.SetStyling(text.GetLength() - start, self._style_for(color))
+
+            # Drop the oldest lines in one operation once the buffer grows past the watermark,
+            # so memory and per-append cost stay bounded in long sessions
+            if text.GetLineCount() > LOG_TRIM_WATERMARK:
+                text.DeleteRange(0, text.PositionFromLine(text.GetLineCount() - MAX_LOG_LINES))
+        finally:
+            text.Thaw()
+            text.SetReadOnly(True)
+
+        text.ScrollToEnd()
 
 class ControlPanel(wx.Panel):
     '''The panel for controlling the application.'''
@@ -545,6 +767,7 @@ class ControlPanel(wx.Panel):
             elif latency > 10000:
                 raise ValueError('Latency must not exceed 10000 ms.')
             self.view.controls.latency = latency
+            self.view.controls.latency_s = latency / 1000.0
             self.latency_input.UnsetToolTip()
             self.latency_input.SetBackgroundColour(wx.NullColour) # Default color
         except ValueError as e:
@@ -561,22 +784,22 @@ class ControlPanel(wx.Panel):
     def on_send_actions_reregister_all(self, event: wx.CommandEvent):
         event.Skip()
 
-        self.view.on_send_actions_reregister_all()
+        self.view.dispatch('send_actions_reregister_all', _noop)()
 
     def on_send_shutdown_graceful(self, event: wx.CommandEvent):
         event.Skip()
 
-        self.view.on_send_shutdown_graceful()
+        self.view.dispatch('send_shutdown_graceful', _noop)()
 
     def on_send_shutdown_graceful_cancel(self, event: wx.CommandEvent):
         event.Skip()
 
-        self.view.on_send_shutdown_graceful_cancel()
+        self.view.dispatch('send_shutdown_graceful_cancel', _noop)()
 
     def on_send_shutdown_immediate(self, event: wx.CommandEvent):
         event.Skip()
 
-        self.view.on_send_shutdown_immediate()
+        self.view.dispatch('send_shutdown_immediate', _noop)()
 
 class ActionDialog(wx.Dialog):
 
@@ -609,19 +832,34 @@ class ActionDialog(wx.Dialog):
         self.Bind(wx.EVT_BUTTON, self.on_show_schema, self.show_schema_button)
         self.Bind(wx.EVT_BUTTON, self.on_cancel, self.cancel_button)
 
-        faker = JSF(action.schema)
-        sample = faker.generate()
+        sample_json = action._sample_json
+
+        if sample_json is None and action.schema is not None:
+            # Fallback in case the sample was not pre-generated at registration
+            sample_json = jsonutil.dumps(action.get_faker().generate(), indent=True)
 
-        self.text.SetValue(json.dumps(sample, indent=2))
+        self.text.SetValue(sample_json or '{}')
+        self._initial_text = self.text.GetValue() # For the unchanged-sample fast path in on_send
 
     def on_send(self, event: wx.CommandEvent):
         event.Skip()
 
         try:
             json_str = self.text.GetValue()
+
+            # The generated sample already conforms to the schema,
+            # so unedited text needs neither parsing nor validation
+            if json_str == self._initial_text:
+                self.EndModal(wx.ID_OK)
+                return
+
             json_cmd = json.loads(json_str)
             if self.do_validate:
-                jsonschema.validate(json_cmd, self.action.schema)
+                validate_fn = self.action._validate_fn
+                if validate_fn is not None:
+                    validate_fn(json_cmd)
+                else:
+                    _get_validator(self.action.schema).validate(json_cmd)
             
             self.EndModal(wx.ID_OK)
             return
@@ -629,6 +867,8 @@ class ActionDialog(wx.Dialog):
         except Exception as e:
             if isinstance(e, jsonschema.ValidationError):
                 wx.MessageBox(f'JSON schema validation error: {e}', 'Error', wx.OK | wx.ICON_ERROR)
+            elif fastjsonschema is not None and isinstance(e, fastjsonschema.JsonSchemaException):
+                wx.MessageBox(f'JSON schema validation error: {e}', 'Error', wx.OK | wx.ICON_ERROR)
             elif isinstance(e, json.JSONDecodeError):
                 wx.MessageBox(f'JSON decode error: {e}', 'Error', wx.OK | wx.ICON_ERROR)
             else:
@@ -637,7 +877,7 @@ class ActionDialog(wx.Dialog):
     def on_show_schema(self, event: wx.CommandEvent):
         event.Skip()
 
-        wx.MessageBox(json.dumps(self.action.schema, indent=2), 'Schema', wx.OK | wx.ICON_INFORMATION)
+        wx.MessageBox(self.action.get_schema_pretty(), 'Schema', wx.OK | wx.ICON_INFORMATION)
 
     def on_cancel(self, event: wx.CommandEvent):
         event.Skip()
@@ -650,6 +890,8 @@ class ActionsForceDialog(wx.Dialog):
         title = 'Forced Action' if not retry else 'Retry Forced Action'
         super().__init__(parent, title=title, style=wx.DEFAULT_DIALOG_STYLE | wx.RESIZE_BORDER)
 
+        self.Freeze() # Defer layout and painting until all children exist
+
         self.view = view
         self.state = state
         self.query = query
@@ -668,13 +910,15 @@ class ActionsForceDialog(wx.Dialog):
         self.sizer.Add(self.action_list, 1, wx.EXPAND | wx.ALL, 2)
         self.SetSizer(self.sizer)
 
-        for action in actions:
-            self.action_list.add_action(action)
+        self.action_list.add_actions(actions) # Batched so the list lays out once
 
         self.action_list.list.Select(0)
 
         self.Bind(EVT_EXECUTE, self.on_execute, self.action_list)
 
+        self.Layout()
+        self.Thaw()
+
     def on_execute(self, event: ExecuteEvent):
         event.Skip()
 
@@ -688,6 +932,7 @@ class Controls:
         self.ignore_actions_force: bool = False
         self.auto_send: bool = False
         self.latency: int = 0
+        self.latency_s: float = 0.0 # Cached latency in seconds, updated alongside latency
 
         self.__log_level_str: str = 'INFO'
         self.__log_level: int = LOG_LEVELS['INFO']